@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import random
+import math
 import asyncio
 from typing import List, Optional
 
-from playwright.async_api import async_playwright, Page, TimeoutError as PlaywrightTimeoutError # Added TimeoutError
+from playwright.async_api import (
+    BrowserContext,
+    Page,
+    TimeoutError as PlaywrightTimeoutError,
+)  # Added TimeoutError
 
 from jobspy.model import (
     Scraper,
@@ -15,57 +19,82 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger
+from jobspy.browser import block_resources, browser_pool, extract_cards, PagePool
+from jobspy.util import create_logger, stable_hash, TTLCache
 
 log = create_logger("ArbetsformedlingenSE")
 
+# Descriptions rarely change, so re-runs within a day reuse the ones already fetched
+description_cache = TTLCache("arbetsformedlingen_descriptions")
+
+CARD_SELECTOR = "pb-feature-search-result-card"
+CARD_FIELDS = {
+    "title": "h3 a",
+    "company": "strong.pb-company-name",
+    "location": "div.pb-location",
+}
+MAIN_CONTENT_SELECTOR = "pb-section-job-main-content"
+
 
 class ArbetsformedlingenScraper(Scraper):
     base_url = "https://arbetsformedlingen.se"
-    delay = 2
-    band_delay = 3
-    country = "Sweden" 
-
-    def __init__(self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None):
-        super().__init__(Site.ARBETSFORMEDLINGEN, proxies=proxies, ca_cert=ca_cert) # site needs to be provided
-        self.scraper_input: Optional[ScraperInput] = None # Initialize as Optional
+    jobs_per_page = 25
+    detail_concurrency = 3
+    country = "Sweden"
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+    ):
+        super().__init__(
+            Site.ARBETSFORMEDLINGEN, proxies=proxies, ca_cert=ca_cert
+        )  # site needs to be provided
+        self.country_enum = Country.from_string(self.country)
+        self.scraper_input: Optional[ScraperInput] = None  # Initialize as Optional
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
-        return asyncio.run(self._async_scrape())
+        return browser_pool.run(self._async_scrape())
 
-    async def _get_job_description_detail(self, page: Page) -> str:
+    async def _get_job_description_detail(self, page: Page) -> tuple[str, bool]:
         """
-        Extracts the job description from the job detail page.
+        Extracts the job description from the job detail page, along with whether it
+        is the actual description and so worth caching.
         This is an async adaptation of the user's get_job_description function.
         """
         try:
-            await page.wait_for_selector("pb-section-job-main-content", timeout=10000)
-            main_content = page.locator("pb-section-job-main-content")
+            await page.wait_for_selector(MAIN_CONTENT_SELECTOR, timeout=10000)
+            main_content = page.locator(MAIN_CONTENT_SELECTOR)
 
             if await main_content.count() == 1:
                 # Try heading "Om jobbet"
                 heading_om_jobbet = main_content.locator("h2", has_text="Om jobbet")
                 if await heading_om_jobbet.count() == 1:
-                    return (await main_content.inner_text()).strip()
-                
+                    return (await main_content.inner_text()).strip(), True
+
                 # Try heading "Om anställningen"
-                heading_om_anstallningen = main_content.locator("h2", has_text="Om anställningen")
+                heading_om_anstallningen = main_content.locator(
+                    "h2", has_text="Om anställningen"
+                )
                 if await heading_om_anstallningen.count() == 1:
-                    return (await main_content.inner_text()).strip()
+                    return (await main_content.inner_text()).strip(), True
 
                 # Otherwise return all text inside main_content
-                return (await main_content.inner_text()).strip()
+                return (await main_content.inner_text()).strip(), True
 
             # Fallback: entire page content (less ideal)
-            log.warning("Main content section not found as expected, falling back to full page content.")
-            return await page.content()
+            log.warning(
+                "Main content section not found as expected, falling back to full page content."
+            )
+            return await page.content(), False
         except PlaywrightTimeoutError:
             log.error("Timeout waiting for job description main content.")
-            return "Error: Could not load job description content."
+            return "Error: Could not load job description content.", False
         except Exception as e:
             log.error(f"Error extracting job description: {e}")
-            return f"Error: Could not extract job description due to {e}"
+            return f"Error: Could not extract job description due to {e}", False
 
     async def _async_scrape(self) -> JobResponse:
         if not self.scraper_input:
@@ -73,199 +102,239 @@ class ArbetsformedlingenScraper(Scraper):
             return JobResponse(jobs=[])
 
         job_list: list[JobPost] = []
-        results_wanted = self.scraper_input.results_wanted or 10 # Default to 10 if not specified
-
-        async with async_playwright() as p:
-            # Consider using self.scraper_input.headless
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context()
-            page = await context.new_page()
-
-            # Go to job search page
-            initial_search_url = f"{self.base_url}/platsbanken/"
-            log.info(f"Navigating to initial search page: {initial_search_url}")
-            await page.goto(initial_search_url, wait_until="domcontentloaded")
-
-            # Accept cookies if visible
-            try:
-                cookie_button = page.get_by_role("button", name="Jag godkänner alla kakor", exact=True)
-                if await cookie_button.is_visible(timeout=5000):
-                    await cookie_button.click()
-                    log.info("✅ Accepted cookies")
-                else:
-                    log.info("🍪 Cookie consent button not visible or already accepted.")
-            except PlaywrightTimeoutError:
-                log.info("⚠️ Cookie consent button not found (timeout) or already accepted.")
-            except Exception as e:
-                log.warning(f"Error handling cookie consent: {e}")
-
-
-            # Fill in search term and submit
-            log.info(f"Performing search for: '{self.scraper_input.search_term}'")
-            await page.get_by_label("Sök på ett eller flera ord,").fill(self.scraper_input.search_term)
-            await page.get_by_label("Sök", exact=True).click()
-
-            # Wait for search results to load
-            try:
-                await page.wait_for_selector("pb-feature-search-result-card", timeout=15000)
-                await asyncio.sleep(2)  # Stabilize content
-            except PlaywrightTimeoutError:
-                log.error("Timeout waiting for initial search results to load.")
-                await browser.close()
-                return JobResponse(jobs=[])
-
-            current_page_num = 1
-            while len(job_list) < results_wanted:
-                log.info(f"Processing search results page {current_page_num}. Found {len(job_list)}/{results_wanted} jobs so far.")
-
-                # If not the first page, navigate to the next page of results
-                if current_page_num > 1:
-                    search_query_param = self.scraper_input.search_term.replace(" ", "+")
-                    next_page_url = (
-                        f"{self.base_url}/platsbanken/annonser?"
-                        f"q={search_query_param}&page={current_page_num}"
-                    )
-                    log.info(f"Navigating to next page: {next_page_url}")
+        results_wanted = (
+            self.scraper_input.results_wanted or 10
+        )  # Default to 10 if not specified
+        # Filled in by _fetch_jobs, so postings already scraped never get a detail visit
+        self._seen_urls: set[str] = set()
+        repeated_pages = 0
+        # Shared by all result pages so the site never sees more than a few detail requests at once
+        self._detail_slots = asyncio.Semaphore(self.detail_concurrency)
+
+        context = await browser_pool.acquire()
+        try:
+            await block_resources(context)
+            async with await PagePool.open(
+                context, size=min(results_wanted // self.jobs_per_page + 1, 5)
+            ) as page_pool:
+                async with page_pool.page() as page:
+                    # Go to job search page once so the cookie consent applies to the whole context
+                    initial_search_url = f"{self.base_url}/platsbanken/"
+                    log.info(f"Navigating to initial search page: {initial_search_url}")
+                    await page.goto(initial_search_url, wait_until="domcontentloaded")
+
+                    # Accept cookies if visible
                     try:
-                        await page.goto(next_page_url, wait_until="domcontentloaded")
-                        await page.wait_for_selector("pb-feature-search-result-card", timeout=10000)
-                        await asyncio.sleep(1) # Stabilize
+                        cookie_button = page.get_by_role(
+                            "button", name="Jag godkänner alla kakor", exact=True
+                        )
+                        if await cookie_button.is_visible(timeout=5000):
+                            await cookie_button.click()
+                            log.info("✅ Accepted cookies")
+                        else:
+                            log.info(
+                                "🍪 Cookie consent button not visible or already accepted."
+                            )
                     except PlaywrightTimeoutError:
-                        log.info(f"No more job cards found on page {current_page_num} or page failed to load. Ending scrape.")
-                        break # No more pages or error
+                        log.info(
+                            "⚠️ Cookie consent button not found (timeout) or already accepted."
+                        )
                     except Exception as e:
-                        log.error(f"Error navigating to page {current_page_num}: {e}")
-                        break
-
+                        log.warning(f"Error handling cookie consent: {e}")
+
+                log.info(f"Performing search for: '{self.scraper_input.search_term}'")
+                current_page_num = 1
+                while len(job_list) < results_wanted:
+                    # Result pages are addressable by URL, so process every page still
+                    # needed concurrently, each on a page from the pool
+                    remaining = results_wanted - len(job_list)
+                    pages_needed = min(
+                        math.ceil(remaining / self.jobs_per_page), page_pool.size
+                    )
+                    page_nums = range(current_page_num, current_page_num + pages_needed)
+                    log.info(
+                        f"Processing search results pages {page_nums[0]}-{page_nums[-1]}. Found {len(job_list)}/{results_wanted} jobs so far."
+                    )
 
-                job_card_locators = await page.locator("pb-feature-search-result-card").all()
-                if not job_card_locators:
-                    log.info(f"No job cards found on page {current_page_num}. This might be the end of results.")
-                    break
-                
-                log.info(f"Found {len(job_card_locators)} job cards on page {current_page_num}.")
+                    results = await asyncio.gather(
+                        *[
+                            page_pool.run(
+                                self._fetch_jobs,
+                                self.scraper_input.search_term,
+                                page_num,
+                                min(
+                                    self.jobs_per_page,
+                                    remaining - i * self.jobs_per_page,
+                                ),
+                            )
+                            for i, page_num in enumerate(page_nums)
+                        ]
+                    )
 
-                for i in range(len(job_card_locators)):
-                    if len(job_list) >= results_wanted:
+                    last_page_reached = False
+                    for page_num, result in zip(page_nums, results):
+                        jobs, mostly_repeats = result or ([], False)
+                        if not jobs and not mostly_repeats:
+                            last_page_reached = True
+                            break
+                        job_list.extend(jobs)
+
+                        # Pages that are mostly repeats mean the paginator has wrapped around
+                        repeated_pages = repeated_pages + 1 if mostly_repeats else 0
+                        if repeated_pages >= 2:
+                            log.info(
+                                f"Page {page_num} repeats earlier postings, stopping"
+                            )
+                            last_page_reached = True
+                            break
+
+                    if last_page_reached:
                         break
-                    
-                    # Re-locate the card to avoid staleness issues after navigation
-                    # This is important because page.go_back() reloads, and locators might become stale.
-                    # We need to ensure we are still on the search results page before re-locating.
-                    try:
-                        await page.wait_for_selector("pb-feature-search-result-card", timeout=5000) # Ensure we are on results page
-                    except PlaywrightTimeoutError:
-                        log.error("Lost search results page context. Aborting current page processing.")
-                        break # Break from inner loop, will try next page or end.
+                    current_page_num += pages_needed
 
-                    job_card = page.locator("pb-feature-search-result-card").nth(i)
+                log.info(
+                    f"Scraping finished. Total jobs extracted: {min(len(job_list), results_wanted)}"
+                )
+        finally:
+            await browser_pool.release(context)
 
+        return JobResponse(jobs=job_list[:results_wanted])
+
+    async def _fetch_jobs(
+        self, page: Page, query: str, page_num: int, limit: int
+    ) -> tuple[List[JobPost], bool] | None:
+        """
+        Processes a single page of search results, visiting the detail page of up to
+        `limit` job cards on it that were not scraped before. Also returns whether
+        most of the cards on the page were repeats.
+        """
+        search_query_param = query.replace(" ", "+")
+        results_url = (
+            f"{self.base_url}/platsbanken/annonser?"
+            f"q={search_query_param}&page={page_num}"
+        )
+        log.info(f"Navigating to results page: {results_url}")
+        try:
+            await page.goto(results_url, wait_until="commit")
+            await page.wait_for_selector(CARD_SELECTOR, timeout=15000)
+        except PlaywrightTimeoutError:
+            log.info(
+                f"No more job cards found on page {page_num} or page failed to load. Ending scrape."
+            )
+            return None
+        except Exception as e:
+            log.error(f"Error navigating to page {page_num}: {e}")
+            return None
+
+        # Read every card in one round trip instead of several per card
+        try:
+            cards = await extract_cards(page, CARD_SELECTOR, CARD_FIELDS)
+        except Exception as e:
+            log.error(f"Error reading job cards on page {page_num}: {e}")
+            return None
+        if not cards:
+            log.info(
+                f"No job cards found on page {page_num}. This might be the end of results."
+            )
+            return None
+
+        log.info(f"Found {len(cards)} job cards on page {page_num}.")
+
+        listings: list[tuple[str, str, str, str]] = []
+        repeats = 0
+        for i, card in enumerate(cards):
+            if len(listings) >= limit:
+                break
+
+            title = card["title"]
+            link = card["title_href"]
+            if not title or not link:
+                log.warning(
+                    f"Could not get title or link for job card {i+1} on page {page_num}. Skipping."
+                )
+                continue
+
+            detail_url = f"{self.base_url}{link}" if link.startswith("/") else link
+            if detail_url in self._seen_urls:
+                repeats += 1
+                continue
+            self._seen_urls.add(detail_url)
+
+            company_name = card["company"] or "N/A"
+
+            # Arbetsförmedlingen often includes location in company or has a separate field
+            location_text = card["location"] or "N/A"
+            if (
+                location_text == "N/A"
+            ):  # Fallback: parse from company string (simplistic)
+                parts = company_name.split(",")
+                if len(parts) > 1:
+                    location_text = parts[
+                        -1
+                    ].strip()  # Assume last part after comma is city
+                    company_name = ",".join(parts[:-1]).strip()
+
+            listings.append((title, detail_url, company_name, location_text))
+
+        # Open the detail pages side by side instead of going back and forth on one page
+        job_posts = await asyncio.gather(
+            *[self._fetch_job_detail(page.context, *listing) for listing in listings]
+        )
+        mostly_repeats = repeats > (repeats + len(listings)) / 2
+        return [job_post for job_post in job_posts if job_post], mostly_repeats
+
+    async def _fetch_job_detail(
+        self,
+        context: BrowserContext,
+        title: str,
+        detail_url: str,
+        company_name: str,
+        location_text: str,
+    ) -> JobPost | None:
+        """Opens the job detail page in a page of its own and builds the JobPost"""
+        try:
+            # sqlite is blocking, so keep the cache off the event loop
+            description = await asyncio.to_thread(description_cache.get, detail_url)
+            if description is None:
+                async with self._detail_slots:
+                    page = await context.new_page()
                     try:
-                        title_el = job_card.locator("h3 a")
-                        title = (await title_el.inner_text()).strip()
-                        link = await title_el.get_attribute("href")
-                        if not link:
-                            log.warning(f"Could not get link for job card {i+1} on page {current_page_num}. Skipping.")
-                            continue
-                        
-                        detail_url = f"{self.base_url}{link}" if link.startswith("/") else link
-
-                        company_el = job_card.locator("strong.pb-company-name")
-                        company_raw = (await company_el.inner_text()).strip() if await company_el.count() > 0 else "N/A"
-                        
-                        # Attempt to get a more specific location if available
-                        # Arbetsförmedlingen often includes location in company or has a separate field
-                        location_text = "N/A"
-                        location_el = job_card.locator("div.pb-location") # Common selector for location
-                        if await location_el.count() > 0:
-                            location_text = (await location_el.inner_text()).strip()
-                        else: # Fallback if specific location element not found, parse from company string (simplistic)
-                            parts = company_raw.split(',')
-                            if len(parts) > 1:
-                                location_text = parts[-1].strip() # Assume last part after comma is city
-                                company_name = ','.join(parts[:-1]).strip()
-                            else:
-                                company_name = company_raw
-                                # Could try to extract city from company_raw using regex if needed
-                        
-                        if location_text == "N/A" and company_name != "N/A": # if location still N/A try from company
-                             parts = company_name.split(',')
-                             if len(parts) > 1:
-                                location_text = parts[-1].strip()
-                                company_name = ','.join(parts[:-1]).strip()
-
-
-                        log.info(f"🔗 Navigating to job detail: {title} at {detail_url}")
-                        await page.goto(detail_url, wait_until="domcontentloaded")
-                        
-                        description = await self._get_job_description_detail(page)
-                        
-                        # For published date, it's often relative ("Idag", "Igår", "3 dagar sedan")
-                        # You might need more complex parsing or decide if it's crucial.
-                        # Example for date from your sync code:
-                        # pub_date_el = job_card.locator("div.bottom__left > div.ng-star-inserted").nth(1)
-                        # pub_date = (await pub_date_el.inner_text()).strip() if await pub_date_el.count() > 0 else None
-                        
-                        job_post = JobPost(
-                            id=f"arbetsformedlingen-{abs(hash(detail_url))}", # Simple unique ID
-                            title=title,
-                            company_name=company_name,
-                            location=Location(
-                                country=Country.from_string(self.country), 
-                                city=location_text, 
-                                state=None # Sweden doesn't use states like the US
-                            ),
-                            job_url=detail_url,
-                            description=description,
-                            # date_posted=pub_date, # If you extract and parse it
+                        log.info(
+                            f"🔗 Navigating to job detail: {title} at {detail_url}"
                         )
-                        job_list.append(job_post)
-                        log.info(f"✅ Extracted job {len(job_list)}/{results_wanted}: {title}")
-
-                        # Go back to search results
-                        await page.go_back(wait_until="domcontentloaded")
-                        # Ensure search results are loaded again
-                        await page.wait_for_selector("pb-feature-search-result-card", timeout=10000)
-                        await asyncio.sleep(random.uniform(0.5, 1.5)) # Short delay after going back
-
-                    except PlaywrightTimeoutError as e:
-                        log.error(f"Timeout processing job card {i+1} on page {current_page_num}: {e}. Skipping card.")
-                        # If a timeout occurs, try to go back to a stable state (search results)
-                        if page.url != initial_search_url and not page.url.startswith(f"{self.base_url}/platsbanken/annonser"):
-                            try:
-                                await page.go_back(wait_until="domcontentloaded")
-                                await page.wait_for_selector("pb-feature-search-result-card", timeout=5000)
-                            except Exception as ex:
-                                log.warning(f"Failed to go back to search results after error: {ex}")
-                                break # Break inner loop
-                        continue # Skip to next card
-                    except Exception as e:
-                        log.error(f"Error processing job card {i+1} on page {current_page_num}: {e}. Skipping card.")
-                        # Similar recovery attempt
-                        if page.url != initial_search_url and not page.url.startswith(f"{self.base_url}/platsbanken/annonser"):
-                            try:
-                                await page.go_back(wait_until="domcontentloaded")
-                                await page.wait_for_selector("pb-feature-search-result-card", timeout=5000)
-                            except Exception as ex:
-                                log.warning(f"Failed to go back to search results after error: {ex}")
-                                break # Break inner loop
-                        continue
-
-
-                if len(job_list) >= results_wanted:
-                    log.info(f"Reached desired number of results ({results_wanted}).")
-                    break
-                
-                # If no jobs were processed on this page (e.g. all skipped due to errors, or no cards)
-                # and we haven't reached results_wanted, it implies no more valid jobs on this page.
-                if not job_card_locators: # if we broke out because no cards initially
-                    break
-
-
-                current_page_num += 1
-                await asyncio.sleep(random.uniform(self.delay, self.delay + self.band_delay)) # Delay between pages
-
-            await browser.close()
-            log.info(f"Scraping finished. Total jobs extracted: {len(job_list)}")
-
-        return JobResponse(jobs=job_list)
\ No newline at end of file
+                        await page.goto(detail_url, wait_until="commit")
+                        description, cacheable = await self._get_job_description_detail(
+                            page
+                        )
+                    finally:
+                        await page.close()
+                # Errors and the full-page fallback are worth retrying next run
+                if cacheable:
+                    await asyncio.to_thread(
+                        description_cache.set, detail_url, description
+                    )
+
+            # For published date, it's often relative ("Idag", "Igår", "3 dagar sedan")
+            # You might need more complex parsing or decide if it's crucial.
+            # Example for date from your sync code:
+            # pub_date_el = job_card.locator("div.bottom__left > div.ng-star-inserted").nth(1)
+            # pub_date = (await pub_date_el.inner_text()).strip() if await pub_date_el.count() > 0 else None
+
+            job_post = JobPost.model_construct(
+                id=f"arbetsformedlingen-{stable_hash(detail_url)}",  # Simple unique ID
+                title=title,
+                company_name=company_name,
+                location=Location.model_construct(
+                    country=self.country_enum,
+                    city=location_text,
+                    state=None,  # Sweden doesn't use states like the US
+                ),
+                job_url=detail_url,
+                description=description,
+                # date_posted=pub_date, # If you extract and parse it
+            )
+            log.info(f"✅ Extracted job: {title}")
+            return job_post
+        except Exception as e:
+            log.error(f"Error processing job detail {detail_url}: {e}. Skipping card.")
+            return None
@@ -0,0 +1,462 @@
+"""
+jobspy.browser
+~~~~~~~~~~~~~~
+
+This module contains the Playwright browser pool shared by the browser based scrapers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import math
+import os
+import re
+import shutil
+import tempfile
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, TypeVar
+
+from playwright.async_api import (
+    async_playwright,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+)
+
+from jobspy.model import (
+    Country,
+    JobPost,
+    JobResponse,
+    Location,
+    Scraper,
+    ScraperInput,
+)
+from jobspy.util import create_logger, run_async, stable_hash
+
+log = create_logger("BrowserPool")
+
+T = TypeVar("T")
+
+# requests the scrapers never need, since they only read text out of the DOM
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+TRACKER_PATTERN = re.compile(
+    r"googletagmanager|google-analytics|doubleclick|hotjar|facebook\.net"
+)
+
+# Nothing is ever displayed, so skip the GPU and per-site renderer processes
+LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-features=IsolateOrigins,site-per-process",
+    "--disable-blink-features=AutomationControlled",
+]
+
+# For every element matching `card`, finds the first descendant matching each field
+# selector with a single querySelectorAll over all of them joined together, and
+# returns its trimmed text under the field name and its href under `<name>_href`
+CARD_FIELDS_JS = """({card, fields}) => {
+    const entries = Object.entries(fields);
+    const joined = entries.map(([, selector]) => selector).join(", ");
+    return Array.from(document.querySelectorAll(card)).map(el => {
+        const row = {};
+        for (const match of el.querySelectorAll(joined)) {
+            for (const [name, selector] of entries) {
+                if (!(name in row) && match.matches(selector)) {
+                    row[name] = match.innerText.trim();
+                    row[name + "_href"] = match.getAttribute("href");
+                }
+            }
+        }
+        for (const [name] of entries) {
+            if (!(name in row)) {
+                row[name] = null;
+                row[name + "_href"] = null;
+            }
+        }
+        return row;
+    });
+}"""
+
+
+class BrowserPool:
+    """
+    Process-wide pool of headless Chromium browsers, each launched with a persistent
+    context so its connections, DNS cache and TLS sessions stay warm between scrapes.
+
+    Playwright objects belong to the event loop that created them, so the pool lives
+    on the shared background loop of util.run_async and every coroutine that uses a
+    pooled browser has to be executed on it through run().
+    """
+
+    def __init__(self, min_size: int = 0, max_size: int = 3, idle_timeout: float = 60):
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._playwright: Playwright | None = None
+        self._idle: asyncio.Queue[tuple[BrowserContext, float]] = asyncio.Queue()
+        self._profiles: dict[BrowserContext, str] = {}
+        self._closed: weakref.WeakSet[BrowserContext] = weakref.WeakSet()
+        self._lock = asyncio.Lock()
+        # Set whenever a browser is released or a slot frees up, wakes up waiters
+        self._available = asyncio.Event()
+        self._size = 0
+        self._evictor: asyncio.Task | None = None
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the pool's event loop and blocks until it is done."""
+        return run_async(coro)
+
+    async def acquire(self) -> BrowserContext:
+        """
+        Returns the context of an idle browser, launching a new one if the pool is not
+        full yet, otherwise waits for another scraper to release one.
+        """
+        while True:
+            async with self._lock:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                    atexit.register(self.close)
+                    self._evictor = asyncio.create_task(self._evict_idle())
+                while not self._idle.empty():
+                    context, _ = self._idle.get_nowait()
+                    # Browsers that closed while idle already gave their slot back
+                    if context not in self._closed:
+                        return context
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                self._available.clear()
+            await self._available.wait()
+
+        try:
+            log.debug(f"Launching browser {self._size}/{self.max_size}")
+            return await self._launch()
+        except Exception:
+            self._free_slot()
+            raise
+
+    async def release(self, context: BrowserContext) -> None:
+        """Hands a browser back to the pool so the next scraper can reuse it."""
+        if context not in self._closed:
+            self._idle.put_nowait((context, time.monotonic()))
+            self._available.set()
+
+    def close(self) -> None:
+        """Closes all browsers, registered to run at exit once the pool is used."""
+        if self._playwright is None:
+            return
+        try:
+            run_async(self._shutdown(), timeout=30)
+        except Exception as e:
+            log.warning(f"Error shutting down browser pool: {e}")
+
+    async def _launch(self) -> BrowserContext:
+        # Each browser needs a profile directory of its own, Chromium locks it
+        profile = tempfile.mkdtemp(prefix="jobspy-profile-")
+        try:
+            context = await self._playwright.chromium.launch_persistent_context(
+                profile,
+                headless=True,
+                args=LAUNCH_ARGS,
+                viewport={"width": 1280, "height": 800},
+            )
+        except Exception:
+            shutil.rmtree(profile, ignore_errors=True)
+            raise
+        self._profiles[context] = profile
+        context.on("close", lambda _: self._on_close(context))
+        return context
+
+    async def _close(self, context: BrowserContext) -> None:
+        await context.close()
+        self._on_close(context)
+
+    def _on_close(self, context: BrowserContext) -> None:
+        """
+        Frees the slot and profile of a closed browser, whether the pool closed it or
+        it went away on its own (e.g. a crash). Safe to call more than once.
+        """
+        if context in self._closed:
+            return
+        self._closed.add(context)
+        shutil.rmtree(self._profiles.pop(context, ""), ignore_errors=True)
+        self._free_slot()
+
+    def _free_slot(self) -> None:
+        self._size -= 1
+        self._available.set()
+
+    async def _evict_idle(self) -> None:
+        """Closes browsers that have not been used for longer than idle_timeout."""
+        while True:
+            await asyncio.sleep(self.idle_timeout / 2)
+            now = time.monotonic()
+            kept, expired = [], []
+            while not self._idle.empty():
+                context, released_at = self._idle.get_nowait()
+                if (
+                    now - released_at > self.idle_timeout
+                    and self._size - len(expired) > self.min_size
+                ):
+                    expired.append(context)
+                else:
+                    kept.append((context, released_at))
+            for item in kept:
+                self._idle.put_nowait(item)
+            for context in expired:
+                log.debug(f"Closing browser idle for over {self.idle_timeout}s")
+                await self._close(context)
+
+    async def _shutdown(self) -> None:
+        if self._evictor:
+            self._evictor.cancel()
+        while not self._idle.empty():
+            context, _ = self._idle.get_nowait()
+            await self._close(context)
+        self._size = 0
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+class PagePool:
+    """
+    Fixed set of pages opened once on a context and handed out to concurrent tasks,
+    so fetching many pages neither opens a tab per fetch nor exceeds `size` tabs.
+    """
+
+    def __init__(self, context: BrowserContext, size: int):
+        self.context = context
+        self.size = size
+        self._pages: asyncio.Queue[Page] = asyncio.Queue()
+
+    @classmethod
+    async def open(cls, context: BrowserContext, size: int) -> PagePool:
+        page_pool = cls(context, size)
+        for _ in range(size):
+            page_pool._pages.put_nowait(await context.new_page())
+        return page_pool
+
+    async def acquire(self) -> Page:
+        return await self._pages.get()
+
+    async def release(self, page: Page) -> None:
+        """Returns a page to the pool after clearing its state by leaving the site."""
+        try:
+            await page.goto("about:blank")
+        except Exception:
+            await page.close()
+            page = await self.context.new_page()
+        self._pages.put_nowait(page)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def run(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """Calls func(page, *args) with a page from the pool."""
+        async with self.page() as page:
+            return await func(page, *args)
+
+    async def close(self) -> None:
+        """Closes the pool's pages, the context itself stays open for reuse."""
+        while not self._pages.empty():
+            await self._pages.get_nowait().close()
+
+    async def __aenter__(self) -> PagePool:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+async def extract_cards(
+    page: Page, card_selector: str, fields: dict[str, str]
+) -> list[dict[str, str | None]]:
+    """
+    Reads the text and href of each field of every card on the page in one round
+    trip, e.g. extract_cards(page, ".card", {"title": "h2 a"}) returns
+    [{"title": ..., "title_href": ...}, ...].
+    """
+    return await page.evaluate(
+        CARD_FIELDS_JS, {"card": card_selector, "fields": fields}
+    )
+
+
+async def block_resources(context: BrowserContext) -> None:
+    """
+    Aborts image, media, font and stylesheet requests as well as tracker requests
+    for every page of the context. Pooled contexts are reused, so the route is only
+    added the first time.
+    """
+    if context in _blocking_contexts:
+        return
+    _blocking_contexts.add(context)
+    await context.route("**/*", _route_request)
+
+
+_blocking_contexts: weakref.WeakSet[BrowserContext] = weakref.WeakSet()
+
+
+async def _route_request(route: Route) -> None:
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or TRACKER_PATTERN.search(
+        request.url
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class PlaywrightListScraper(Scraper):
+    """
+    Scraper for job boards whose search results are a list of cards on pages that
+    are addressable by URL. Subclasses only describe the site through the class
+    attributes below, e.g. search_path = "/jobs?search={query}&page={page}".
+    """
+
+    base_url: str
+    country: str
+    id_prefix: str
+    search_path: str
+    query_separator = "+"
+    jobs_per_page = 20
+
+    card_selector: str
+    title_selector: str
+    company_selector: str
+    location_selector: str
+
+    def __init__(self, site, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        self.scraper_input: ScraperInput | None = None
+        self.country_enum = Country.from_string(self.country)
+        # Built once and handed to every extract_cards call as is
+        self.card_fields = {
+            "title": self.title_selector,
+            "company": self.company_selector,
+            "location": self.location_selector,
+        }
+        self.log = create_logger(type(self).__name__.removesuffix("Scraper"))
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        self.scraper_input = scraper_input
+        return browser_pool.run(self._async_scrape())
+
+    async def _async_scrape(self) -> JobResponse:
+        job_list: list[JobPost] = []
+        results_wanted = self.scraper_input.results_wanted or 10
+
+        context = await browser_pool.acquire()
+        try:
+            await block_resources(context)
+            async with await PagePool.open(
+                context, size=min(results_wanted // self.jobs_per_page + 1, 5)
+            ) as page_pool:
+                current_page_num = 1
+
+                while len(job_list) < results_wanted:
+                    # Result pages are addressable by URL, so fetch every page still
+                    # needed concurrently, each on a page from the pool
+                    pages_needed = min(
+                        math.ceil(
+                            (results_wanted - len(job_list)) / self.jobs_per_page
+                        ),
+                        page_pool.size,
+                    )
+                    page_nums = range(current_page_num, current_page_num + pages_needed)
+                    self.log.info(f"Fetching jobs pages {page_nums[0]}-{page_nums[-1]}")
+
+                    results = await asyncio.gather(
+                        *[
+                            page_pool.run(
+                                self._fetch_jobs,
+                                self.scraper_input.search_term,
+                                page_num,
+                            )
+                            for page_num in page_nums
+                        ]
+                    )
+
+                    last_page_reached = False
+                    for jobs in results:
+                        if not jobs:
+                            last_page_reached = True
+                            break
+                        job_list.extend(jobs)
+
+                    if last_page_reached:
+                        break
+                    current_page_num += pages_needed
+        finally:
+            await browser_pool.release(context)
+
+        return JobResponse(jobs=job_list[:results_wanted])
+
+    async def _fetch_jobs(
+        self, page: Page, query: str, page_num: int
+    ) -> list[JobPost] | None:
+        try:
+            url = self.base_url + self.search_path.format(
+                query=query.replace(" ", self.query_separator), page=page_num
+            )
+            await page.goto(url, wait_until="commit")
+            await page.wait_for_selector(self.card_selector, timeout=10000)
+
+            # Read every card in one round trip instead of several per card
+            job_cards = await extract_cards(page, self.card_selector, self.card_fields)
+            if not job_cards:
+                self.log.debug(f"No job cards found on page {page_num}")
+                return None
+
+            self.log.debug(f"Found {len(job_cards)} job cards on page {page_num}")
+
+            job_posts = []
+            for card in job_cards:
+                job_post = self._extract_job_info(card)
+                if job_post:
+                    job_posts.append(job_post)
+
+            return job_posts
+
+        except Exception as e:
+            self.log.error(f"Error fetching jobs: {str(e)}")
+            return None
+
+    def _extract_job_info(self, card: dict[str, str | None]) -> JobPost | None:
+        try:
+            href = card["title_href"]
+            if not card["title"] or not href:
+                return None
+            job_url = href if href.startswith("http") else f"{self.base_url}{href}"
+
+            return JobPost.model_construct(
+                id=f"{self.id_prefix}-{stable_hash(job_url)}",
+                title=card["title"],
+                company_name=card["company"],
+                location=Location.model_construct(
+                    city=card["location"], country=self.country_enum
+                ),
+                job_url=job_url,
+            )
+
+        except Exception as e:
+            self.log.error(f"Error extracting job details: {str(e)}")
+            return None
+
+
+# One browser is kept warm after the first scrape, so services that call scrape()
+# repeatedly only pay the Chromium start-up once per process
+browser_pool = BrowserPool(
+    min_size=int(os.getenv("JOBSPY_POOL_MIN", "1")),
+    max_size=int(os.getenv("JOBSPY_POOL_MAX", "3")),
+)
@@ -6,77 +6,68 @@ This module contains the set of Scrapers' exceptions.
 """
 
 
-class LinkedInException(Exception):
+class JobSpyException(Exception):
+    site = "JobSpy"
+
     def __init__(self, message=None):
-        super().__init__(message or "An error occurred with LinkedIn")
+        super().__init__(message or f"An error occurred with {self.site}")
 
 
-class IndeedException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Indeed")
+class LinkedInException(JobSpyException):
+    site = "LinkedIn"
 
 
-class ZipRecruiterException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with ZipRecruiter")
+class IndeedException(JobSpyException):
+    site = "Indeed"
 
 
-class GlassdoorException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Glassdoor")
+class ZipRecruiterException(JobSpyException):
+    site = "ZipRecruiter"
 
 
-class GoogleJobsException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Google Jobs")
+class GlassdoorException(JobSpyException):
+    site = "Glassdoor"
 
 
-class BaytException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Bayt")
+class GoogleJobsException(JobSpyException):
+    site = "Google Jobs"
 
-class NaukriException(Exception):
-    def __init__(self,message=None):
-        super().__init__(message or "An error occurred with Naukri")
 
+class BaytException(JobSpyException):
+    site = "Bayt"
 
-class BDJobsException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with BDJobs")
 
-class ProfessionHUException(Exception):
-    def __init__(self,message=None):
-        super().__init__(message or "An error occurred with ProfessionHU")
+class NaukriException(JobSpyException):
+    site = "Naukri"
 
-class ProfessionHUException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with ProfessionHU")
 
+class BDJobsException(JobSpyException):
+    site = "BDJobs"
 
-class PosaoHRException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Posao.hr")
 
+class ProfessionHUException(JobSpyException):
+    site = "ProfessionHU"
 
-class InfoJobsException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with InfoJobs")
 
+class PosaoHRException(JobSpyException):
+    site = "Posao.hr"
 
-class PracujPLException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Pracuj.pl")
 
+class InfoJobsException(JobSpyException):
+    site = "InfoJobs"
 
-class KarriereATException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Karriere.at")
 
+class PracujPLException(JobSpyException):
+    site = "Pracuj.pl"
 
-class ArbetsformedlingenException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Arbetsformedlingen")
 
-class UpworkException(Exception):
-    def __init__(self, message=None):
-        super().__init__(message or "An error occurred with Upwork")
\ No newline at end of file
+class KarriereATException(JobSpyException):
+    site = "Karriere.at"
+
+
+class ArbetsformedlingenException(JobSpyException):
+    site = "Arbetsformedlingen"
+
+
+class UpworkException(JobSpyException):
+    site = "Upwork"
@@ -0,0 +1,295 @@
+"""
+jobspy.firecrawl
+~~~~~~~~~~~~~~~~
+
+This module contains the base of the scrapers that fetch a search page through
+Firecrawl and extract its job postings with Gemini.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from abc import abstractmethod
+from typing import TYPE_CHECKING, AsyncIterator
+from urllib.parse import quote, urlencode
+
+import requests
+
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobListing,
+    JobPost,
+    JobResponse,
+    JobType,
+    Location,
+    Scraper,
+    ScraperInput,
+)
+from jobspy.util import (
+    create_logger,
+    create_session,
+    JSONArrayStream,
+    RateLimiter,
+    run_async,
+    stable_hash,
+    TTLCache,
+)
+
+if TYPE_CHECKING:
+    from google import genai
+
+FIRECRAWL_SCRAPE_URL = "https://api.firecrawl.dev/v1/scrape"
+# Firecrawl keeps scraped pages for 4 hours, results are cached locally as long
+CACHE_TTL = 4 * 60 * 60
+
+# Firecrawl limits requests per account, so every site shares the one bucket
+request_limiter = RateLimiter(rate=4, burst=4)
+
+
+class FirecrawlGeminiScraper(Scraper):
+    """
+    Scraper for job boards whose search results page is fetched as markdown by
+    Firecrawl and turned into job postings by Gemini. Subclasses only describe the
+    site through the class attributes below and _search_params, e.g.
+    search_url = "https://example.com/jobs/{slug}/?{params}".
+    """
+
+    base_url: str
+    search_url: str
+    prompt_preamble: str
+    country: str | None = None
+    max_concurrent_scrapes = 10
+
+    def __init__(self, site, proxies=None, ca_cert=None, user_agent=None):
+        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        self.scraper_input: ScraperInput | None = None
+        self.country_enum = Country.from_string(self.country) if self.country else None
+        self.name = type(self).__name__.removesuffix("Scraper")
+        self.log = create_logger(self.name)
+        # Reused by every scrape so the API connections stay alive between calls
+        self.session = create_session(is_tls=False)
+        self.gemini_client: genai.Client | None = None
+        # Extracted listings keyed on the exact search URL, skipping Firecrawl and
+        # Gemini. They hold plain strings and numbers only, so they round-trip
+        # through JSON, unlike JobPost whose enum values are tuples
+        self.listing_cache = TTLCache(f"{site.value}_listings", ttl=CACHE_TTL)
+
+    def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        self.scraper_input = scraper_input
+        return run_async(self._async_scrape(scraper_input))
+
+    def scrape_many(self, scraper_inputs: list[ScraperInput]) -> list[JobResponse]:
+        """Scrapes several searches concurrently, one JobResponse per input"""
+        return run_async(self._async_scrape_many(scraper_inputs))
+
+    async def _async_scrape_many(
+        self, scraper_inputs: list[ScraperInput]
+    ) -> list[JobResponse]:
+        slots = asyncio.Semaphore(self.max_concurrent_scrapes)
+
+        async def scrape_one(scraper_input: ScraperInput) -> JobResponse:
+            async with slots:
+                return await self._async_scrape(scraper_input)
+
+        return await asyncio.gather(*(scrape_one(inp) for inp in scraper_inputs))
+
+    async def _async_scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        try:
+            url = self._search_url(scraper_input.search_term)
+            # Each listing is converted to a JobPost as soon as it has been streamed
+            job_posts = await self._convert_to_job_posts(self._job_listings(url))
+
+            self.log.info(
+                f"Successfully scraped {len(job_posts)} {self.name} positions"
+            )
+            return JobResponse(jobs=job_posts)
+
+        except Exception as e:
+            self.log.error(f"Error scraping {self.name}: {str(e)}")
+            return JobResponse(jobs=[])
+
+    async def _job_listings(self, url: str) -> AsyncIterator[JobListing]:
+        """
+        Yields the listings of the search page, replaying them from the listing cache
+        when the same URL was extracted recently
+        """
+        # sqlite is blocking, so keep the cache off the event loop
+        cached = await asyncio.to_thread(self.listing_cache.get, url)
+        if cached is not None:
+            try:
+                job_listings = [
+                    JobListing.model_validate(item) for item in json.loads(cached)
+                ]
+            except ValueError as e:
+                self.log.warning(f"Ignoring unreadable cache entry for {url}: {e}")
+            else:
+                self.log.info(f"Returning cached {self.name} results")
+                for job in job_listings:
+                    yield job
+                return
+
+        # 1. Scrape with Firecrawl and 2. process with Gemini
+        markdown_content = await self._scrape_with_firecrawl(url)
+        job_listings = []
+        async for job in self._process_with_gemini(markdown_content):
+            job_listings.append(job)
+            yield job
+
+        if job_listings:
+            await asyncio.to_thread(
+                self.listing_cache.set,
+                url,
+                json.dumps([job.model_dump() for job in job_listings]),
+            )
+
+    @abstractmethod
+    def _search_params(self, search_query: str) -> dict: ...
+
+    def _search_url(self, search_query: str) -> str:
+        return self.search_url.format(
+            slug=quote(search_query.replace(" ", "-")),
+            params=urlencode(self._search_params(search_query), quote_via=quote),
+        )
+
+    async def _scrape_with_firecrawl(self, url: str) -> str:
+        """Scrape the search page using Firecrawl API"""
+        payload = {
+            "url": url,
+            "formats": ["markdown"],
+            "onlyMainContent": True,
+            "proxy": "stealth",
+            "parsePDF": True,
+            "maxAge": CACHE_TTL * 1000,
+            "storeInCache": True,
+        }
+
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {os.getenv('FIRECRAWL_API_KEY')}",
+        }
+
+        try:
+            await request_limiter.wait_async()
+            # requests is blocking, so keep it off the event loop
+            response = await asyncio.to_thread(
+                self.session.post,
+                FIRECRAWL_SCRAPE_URL,
+                headers=headers,
+                json=payload,
+                timeout=60,
+            )
+            response.raise_for_status()
+
+            # json accepts the raw bytes, skipping requests' charset detection and
+            # the intermediate str copy of the large markdown body
+            data = json.loads(response.content)
+            if data.get("success") and "markdown" in data.get("data", {}):
+                return data["data"]["markdown"]
+            else:
+                raise Exception(
+                    f"Firecrawl API error: {data.get('error', 'Unknown error')}"
+                )
+
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Request failed: {str(e)}")
+
+    async def _process_with_gemini(
+        self, markdown_content: str
+    ) -> AsyncIterator[JobListing]:
+        """Streams the structured job data Gemini extracts from the markdown content"""
+        if self.gemini_client is None:
+            # google-genai is slow to import, only load it once Gemini is needed
+            from google import genai
+
+            self.gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+        client = self.gemini_client
+
+        # Keeping the static instruction as a fixed prefix lets Gemini reuse it
+        # through implicit context caching
+        prompt = self.prompt_preamble + markdown_content
+
+        try:
+            stream = JSONArrayStream()
+            async for chunk in await client.aio.models.generate_content_stream(
+                model="gemini-2.5-flash",
+                contents=prompt,
+                config={
+                    "response_mime_type": "application/json",
+                    "response_schema": list[JobListing],
+                },
+            ):
+                for item in stream.feed(chunk.text or ""):
+                    yield JobListing.model_validate(item)
+
+        except Exception as e:
+            raise Exception(f"Gemini API error: {str(e)}")
+
+    async def _convert_to_job_posts(
+        self, job_listings: AsyncIterator[JobListing]
+    ) -> list[JobPost]:
+        """Convert JobListing objects to JobPost objects"""
+        job_posts = []
+        seen_urls: set[str] = set()
+        # Most listings share the same location and pay terms, so build each distinct
+        # Location/Compensation once and reuse it across posts
+        locations: dict[str | None, Location] = {}
+        compensations: dict[tuple, Compensation] = {}
+
+        async for job in job_listings:
+            if job.job_link in seen_urls:
+                continue
+            seen_urls.add(job.job_link)
+            try:
+                job_id = f"{self.site.value}-{stable_hash(job.job_link)}"
+                location_obj = locations.get(job.job_location)
+                if location_obj is None:
+                    location_obj = locations[job.job_location] = Location(
+                        city=job.job_location or self.country,
+                        country=self.country_enum,
+                    )
+
+                compensation_key = (
+                    job.job_interval,
+                    job.job_salary_min,
+                    job.job_salary_max,
+                    job.job_salary_currency,
+                )
+                compensation_obj = compensations.get(compensation_key)
+                if compensation_obj is None:
+                    compensation_obj = compensations[compensation_key] = Compensation(
+                        interval=CompensationInterval.get_interval(job.job_interval),
+                        min_amount=job.job_salary_min,
+                        max_amount=job.job_salary_max,
+                        currency=job.job_salary_currency or "USD",
+                    )
+
+                job_type_enums: list[JobType] = []
+                if job.job_type:
+                    for jt_string in job.job_type:
+                        normalized_jt = jt_string.lower().strip()
+                        for member in JobType:
+                            if normalized_jt in member.value:
+                                job_type_enums.append(member)
+                                break
+
+                job_post = JobPost(
+                    id=job_id,
+                    title=job.job_title,
+                    company_name=job.job_company or "Unknown Client",
+                    location=location_obj,
+                    job_url=job.job_link,
+                    description=job.job_description,
+                    job_type=job_type_enums if job_type_enums else None,
+                    compensation=compensation_obj,
+                )
+                job_posts.append(job_post)
+
+            except Exception as e:
+                self.log.error(f"Error converting job listing to JobPost: {str(e)}")
+                continue
+
+        return job_posts
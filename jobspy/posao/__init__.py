@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import random
 import asyncio
 from typing import List
+from urllib.parse import urlencode
 
-from playwright.async_api import async_playwright, Page
+from bs4 import BeautifulSoup
+from playwright.async_api import Page
 
 from jobspy.model import (
     Scraper,
@@ -15,114 +16,257 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger
+from jobspy.browser import block_resources, browser_pool, PagePool
+from jobspy.util import create_logger, create_session, RateLimiter, stable_hash
 
 log = create_logger("PosaoHR")
 
+# Shared by result and detail pages, over HTTP or in the browser
+request_limiter = RateLimiter(rate=4, burst=4)
+
+# Status codes and page text of the challenge pages served instead of results
+BLOCK_STATUS_CODES = {403, 429, 503}
+BLOCK_MARKERS = (
+    b"cf-chl",
+    b"Just a moment...",
+    b"Attention Required!",
+)
+
+headers = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en",
+}
+
+JOB_LINK_SELECTOR = "main a[href]"
+JOB_LINK_TEXT = "Expires in"
+CONTENT_SELECTOR = "#content"
+
 
 class PosaoHRScraper(Scraper):
     base_url = "https://www.posao.hr"
-    delay = 2
-    band_delay = 3
     country = "Croatia"
+    detail_concurrency = 8
+    browser_pages = 3
 
-    def __init__(self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None):
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+    ):
         super().__init__(Site.POSAOHR, proxies=proxies, ca_cert=ca_cert)
+        self.country_enum = Country.from_string(self.country)
         self.scraper_input: ScraperInput | None = None
+        self.user_agent = user_agent
+        self.session = None
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
-        return asyncio.run(self._async_scrape())
+        # No retries, so a challenge status reaches BLOCK_STATUS_CODES on the first
+        # response and the browser takes over instead of hammering the block
+        self.session = create_session(
+            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False
+        )
+        self.session.headers.update(headers)
+        if self.user_agent:
+            self.session.headers["User-Agent"] = self.user_agent
+        return browser_pool.run(self._async_scrape())
 
     async def _async_scrape(self) -> JobResponse:
         job_list: List[JobPost] = []
         wanted = self.scraper_input.results_wanted or 10
+        seen_urls: set[str] = set()
+        repeated_pages = 0
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            ctx = await browser.new_context()
-            page = await ctx.new_page()
+        self._detail_slots = asyncio.Semaphore(self.detail_concurrency)
+        # Posao.hr is server rendered, so a browser is only started if plain
+        # requests get a challenge page instead
+        self._browser_lock = asyncio.Lock()
+        self._context = None
+        self._page_pool: PagePool | None = None
 
+        try:
             page_num = 1
             while len(job_list) < wanted:
                 log.info(f"📄 Fetching page {page_num}")
-                jobs = await self._fetch_jobs(page, self.scraper_input.search_term, ctx, page_num)
-                if not jobs:
+                links = await asyncio.to_thread(
+                    self._fetch_jobs_http, self.scraper_input.search_term, page_num
+                )
+                if links is None:
+                    page_pool = await self._browser_pages()
+                    links = await page_pool.run(
+                        self._fetch_jobs, self.scraper_input.search_term, page_num
+                    )
+                if not links:
                     break
-                job_list.extend(jobs[: wanted - len(job_list)])
-                page_num += 1
-                await asyncio.sleep(random.uniform(self.delay, self.delay + self.band_delay))
 
-            await browser.close()
+                new_links = []
+                for title, job_url in links:
+                    if job_url not in seen_urls:
+                        seen_urls.add(job_url)
+                        new_links.append((title, job_url))
+
+                posts = await asyncio.gather(
+                    *[
+                        self._process_job_detail(title, job_url)
+                        for title, job_url in new_links[: wanted - len(job_list)]
+                    ]
+                )
+                job_list.extend(post for post in posts if post)
+
+                # Pages that are mostly repeats mean the results have wrapped around
+                repeated_pages = (
+                    repeated_pages + 1 if len(new_links) < len(links) / 2 else 0
+                )
+                if repeated_pages >= 2:
+                    log.info(f"Page {page_num} repeats earlier postings, stopping")
+                    break
+                page_num += 1
+        finally:
+            if self._page_pool is not None:
+                await self._page_pool.close()
+                await browser_pool.release(self._context)
 
         return JobResponse(jobs=job_list)
 
-    async def _fetch_jobs(self, page: Page, query: str, context, page_num: int) -> List[JobPost] | None:
+    async def _browser_pages(self) -> PagePool:
+        """Returns the pages of a pooled browser, acquiring it on first use"""
+        async with self._browser_lock:
+            if self._page_pool is None:
+                log.info("Falling back to the browser")
+                context = await browser_pool.acquire()
+                try:
+                    await block_resources(context)
+                    page_pool = await PagePool.open(context, size=self.browser_pages)
+                except BaseException:
+                    await browser_pool.release(context)
+                    raise
+                self._context, self._page_pool = context, page_pool
+        return self._page_pool
+
+    def _search_url(self, query: str, page_num: int) -> str:
+        return f"{self.base_url}/?{urlencode({'q': query, 'page': page_num})}"
+
+    def _fetch_jobs_http(
+        self, query: str, page_num: int
+    ) -> List[tuple[str, str]] | None:
+        """
+        Returns the (title, url) of every job posting on the search results page,
+        or None if we were served a challenge page that needs a browser.
+        """
+        request_limiter.wait()
         try:
-            # Navigate to search
-            await page.goto(self.base_url, wait_until="load")
-            # Accept cookies using same logic from sync version
-            try:
-                btn = page.get_by_role("button", name="Dopusti sve")
-                await btn.click(timeout=5000)
-                log.info("✅ Clicked 'Dopusti sve'")
-            except Exception:
-                log.info("ℹ️ No cookie button found")
-
-            # Fill the search box and click
-            searchbox = page.get_by_role("searchbox", name="Enter keywords...")
-            await searchbox.click()
-            await searchbox.fill(query)
-            await page.get_by_role("link", name="Search", exact=True).click()
+            response = self.session.get(
+                self._search_url(query, page_num),
+                timeout=self.scraper_input.request_timeout,
+            )
+        except Exception as e:
+            log.warning(
+                f"HTTP fetch of page {page_num} failed, using the browser: {e!r}"
+            )
+            return None
+
+        if response.status_code in BLOCK_STATUS_CODES or any(
+            marker in response.content for marker in BLOCK_MARKERS
+        ):
+            log.info(f"Page {page_num} is a challenge page, using the browser")
+            return None
+        if not response.ok:
+            log.error(f"Page {page_num} returned status {response.status_code}")
+            return []
+
+        # A results page without postings is the end of the results, not a block
+        links = self._parse_job_links(response.text)
+        log.info(f"Found {len(links)} job postings on page {page_num}")
+        return links
+
+    def _parse_job_links(self, html: str) -> List[tuple[str, str]]:
+        """Finds the (title, url) of the job postings in a search results page"""
+        soup = BeautifulSoup(html, "html.parser")
+        out: List[tuple[str, str]] = []
+        for a in soup.select(JOB_LINK_SELECTOR):
+            if JOB_LINK_TEXT not in a.get_text():
+                continue
+            href = a["href"]
+            job_url = href if href.startswith("http") else self.base_url + href
+            out.append((a.get_text(" ", strip=True), job_url))
+        return out
+
+    async def _fetch_jobs(
+        self, page: Page, query: str, page_num: int
+    ) -> List[tuple[str, str]] | None:
+        """Returns the (title, url) of every job posting on the search results page"""
+        try:
+            # Same URL as the HTTP path, so the browser paginates the same way
+            await request_limiter.wait_async()
+            await page.goto(self._search_url(query, page_num), wait_until="commit")
             await page.wait_for_selector("main", timeout=10000)
 
-            # Select job links like the sync code
-            links = page.locator("main a:has-text('Expires in')")
-            count = await links.count()
-            log.info(f"Found {count} job postings on page {page_num}")
-            if count == 0:
-                return None
-
-            out: List[JobPost] = []
-            for i in range(count):
-                link = links.nth(i)
-                title = (await link.inner_text()).strip()
-                href = await link.get_attribute("href")
-                job_url = href if href.startswith("http") else self.base_url + href
-
-                log.debug(f"Processing job: {title} → {job_url}")
-                post = await self._process_job_detail(context, title, job_url)
-                if post:
-                    out.append(post)
-            return out
+            # Take the rendered HTML in one round trip and parse it like the HTTP path
+            links = self._parse_job_links(await page.content())
+            log.info(f"Found {len(links)} job postings on page {page_num}")
+            return links
 
         except Exception as e:
             log.error(f"Error on page {page_num}: {e!r}")
             return None
 
-    async def _process_job_detail(self, context, title: str, job_url: str) -> JobPost | None:
+    async def _process_job_detail(self, title: str, job_url: str) -> JobPost | None:
+        log.debug(f"Processing job: {title} → {job_url}")
+        async with self._detail_slots:
+            description = await asyncio.to_thread(self._fetch_description_http, job_url)
+            if description is None:
+                try:
+                    page_pool = await self._browser_pages()
+                    description = await page_pool.run(self._fetch_description, job_url)
+                except Exception as e:
+                    log.error(f"Browser fallback failed for {job_url}: {e!r}")
+                    return None
+        if description is None:
+            return None
+
+        job_id = f"posaohr-{stable_hash(job_url)}"
+        # Attempt to parse company and location—set placeholders if missing
+        loc, comp = None, None
+        # You can add more parsing logic here if needed
+
+        loc_obj = Location.model_construct(city=loc or "", country=self.country_enum)
+
+        return JobPost.model_construct(
+            id=job_id,
+            title=title,
+            company_name=comp or "",
+            location=loc_obj,
+            job_url=job_url,
+            description=description,
+        )
+
+    def _fetch_description_http(self, job_url: str) -> str | None:
+        """Returns the text of the job detail page, or None if it needs a browser"""
+        request_limiter.wait()
         try:
-            detail = await context.new_page()
-            await detail.goto(job_url)
-            await detail.wait_for_selector("#content", timeout=8000)
-            description = (await detail.locator("#content").inner_text()).strip()
-            await detail.close()
-
-            job_id = f"posaohr-{abs(hash(job_url))}"
-            # Attempt to parse company and location—set placeholders if missing
-            loc, comp = None, None
-            # You can add more parsing logic here if needed
-
-            loc_obj = Location(city=loc or "", country=Country.from_string(self.country))
-
-            return JobPost(
-                id=job_id,
-                title=title,
-                company_name=comp or "",
-                location=loc_obj,
-                job_url=job_url,
-                description=description,
+            response = self.session.get(
+                job_url, timeout=self.scraper_input.request_timeout
             )
+            response.raise_for_status()
+        except Exception as e:
+            log.warning(f"HTTP fetch of {job_url} failed, using the browser: {e!r}")
+            return None
+
+        content = BeautifulSoup(response.text, "html.parser").select_one(
+            CONTENT_SELECTOR
+        )
+        if content is None:
+            return None
+        return content.get_text("\n", strip=True)
+
+    async def _fetch_description(self, detail: Page, job_url: str) -> str | None:
+        await request_limiter.wait_async()
+        try:
+            await detail.goto(job_url, wait_until="commit")
+            await detail.wait_for_selector(CONTENT_SELECTOR, timeout=8000)
+            return (await detail.locator(CONTENT_SELECTOR).inner_text()).strip()
         except Exception as e:
             log.error(f"Failed detail fetch for {job_url}: {e!r}")
-            return None
\ No newline at end of file
+            return None
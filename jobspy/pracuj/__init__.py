@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import random
-import time
+import json
+import math
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin, quote
 import cloudscraper
+from requests.adapters import Retry
 
 from jobspy.model import (
     Scraper,
@@ -17,18 +19,65 @@ from jobspy.model import (
     Location,
     Country,
 )
-from jobspy.util import create_logger
+from jobspy.util import create_logger, RateLimiter, stable_hash
 
 log = create_logger("PracujPL")
 
+# Shared by all scraper instances so concurrent pages still pace themselves
+request_limiter = RateLimiter(rate=4, burst=4)
+
+# Found in the raw bytes of pages served instead of results when we are blocked
+BLOCK_MARKERS = (
+    "Przepraszamy, strona której szukasz jest niedostępna".encode(),
+    b"detected unusual activity",
+)
+
+# Only the offers list is turned into a tree, the rest of the page is skipped
+OFFERS_STRAINER = SoupStrainer(id="offers-list")
+LOCATION_ITEM_RE = re.compile(r"^offer-location-")
+# pracuj.pl is a Next.js site that embeds the search results as JSON in the page
+NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.+?)</script>', re.DOTALL)
+
+# Matched against the raw response bytes, so the page is never decoded for it
+MAX_PAGE_RE = re.compile(
+    rb'data-test="top-pagination-max-page-number"[^>]*>\s*(\d+)\s*<'
+)
+
+
+def _clean_text(text: str | None) -> str:
+    """Normalizes and sanitizes text by removing redundant whitespace."""
+    if not text:
+        return ""
+    # str.split() also splits on non-breaking spaces and drops leading/trailing ones
+    return " ".join(text.split())
+
+
+def _find_key(data, key: str):
+    """Returns the first value stored under `key` anywhere in nested JSON."""
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        data = data.values()
+    elif not isinstance(data, list):
+        return None
+    for value in data:
+        found = _find_key(value, key)
+        if found is not None:
+            return found
+    return None
+
 
 class PracujPLScraper(Scraper):
     base_url = "https://www.pracuj.pl"
-    delay = 2
-    band_delay = 3
     country = "Poland"
-
-    def __init__(self, proxies: list[str] | str | None = None, ca_cert: str | None = None, user_agent: str | None = None):
+    max_workers = 4
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        user_agent: str | None = None,
+    ):
         super().__init__(Site.PRACUJPL, proxies=proxies, ca_cert=ca_cert)
         self.scraper_input = None
         self.scraper = None
@@ -40,68 +89,79 @@ class PracujPLScraper(Scraper):
     def _cloudscraper_scrape(self) -> JobResponse:
         job_list: list[JobPost] = []
         results_wanted = self.scraper_input.results_wanted or 10
-        
-        # Create cloudscraper instance
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
-        
+
+        # Create the cloudscraper instance once, so its keep-alive connections and
+        # Cloudflare clearance cookies carry over to later pages and scrapes
+        if self.scraper is None:
+            self.scraper = cloudscraper.create_scraper(
+                browser={"browser": "chrome", "platform": "windows", "mobile": False}
+            )
+            # Retry on the adapters cloudscraper mounted itself, replacing them
+            # would drop its TLS cipher configuration. Only connection errors are
+            # retried: cloudscraper solves Cloudflare challenges from the 403/429/503
+            # responses, which it never sees if urllib3 retries them first
+            retries = Retry(total=2, connect=2, read=2, status=0, backoff_factor=0.5)
+            for adapter in self.scraper.adapters.values():
+                adapter.max_retries = retries
+
         try:
             # Build initial URL
             url = self._build_url(
                 keywords=self.scraper_input.search_term,
-                city=getattr(self.scraper_input, 'location', None),
-                page=1
+                city=getattr(self.scraper_input, "location", None),
+                page=1,
             )
-            
+
             log.info(f"Fetching initial PracujPL jobs from: {url}")
-            
+
             # Get first page
             response = self._make_request(url)
             if not response:
                 return JobResponse(jobs=[])
-            
+
             # Get max page number
-            max_page_num = self._get_max_page_number(response.text)
+            max_page_num = self._get_max_page_number(response.content)
             log.info(f"Found {max_page_num} pages of results")
-            
-            current_page_num = 1
-            while len(job_list) < results_wanted and current_page_num <= max_page_num:
-                log.info(f"Processing page {current_page_num} of {max_page_num}")
-                
-                # Parse the current page
-                jobs = self._parse_jobs_from_page(response.text, response.url)
-                if not jobs:
-                    break
-                
-                job_list.extend(jobs[: results_wanted - len(job_list)])
-                
-                # Move to next page if needed
-                if current_page_num < max_page_num and len(job_list) < results_wanted:
-                    current_page_num += 1
-                    next_page_url = self._build_url(
-                        keywords=self.scraper_input.search_term,
-                        city=getattr(self.scraper_input, 'location', None),
-                        page=current_page_num
+
+            jobs = self._parse_response(response)
+            if not jobs:
+                return JobResponse(jobs=[])
+            job_list.extend(jobs[:results_wanted])
+
+            # The remaining pages are addressable by URL, so fetch them in small
+            # concurrent batches, request_limiter keeps the overall request rate down
+            last_page_num = min(max_page_num, math.ceil(results_wanted / len(jobs)))
+            page_nums = list(range(2, last_page_num + 1))
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for start in range(0, len(page_nums), self.max_workers):
+                    if len(job_list) >= results_wanted:
+                        break
+                    batch = page_nums[start : start + self.max_workers]
+                    log.info(
+                        f"Processing pages {batch[0]}-{batch[-1]} of {max_page_num}"
                     )
-                    log.info(f"Navigating to page {current_page_num}: {next_page_url}")
-                    
-                    # Add delay between requests
-                    time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                    
-                    response = self._make_request(next_page_url)
-                    if not response:
+                    urls = [
+                        self._build_url(
+                            keywords=self.scraper_input.search_term,
+                            city=getattr(self.scraper_input, "location", None),
+                            page=page_num,
+                        )
+                        for page_num in batch
+                    ]
+                    last_page_reached = False
+                    for response in executor.map(self._make_request, urls):
+                        jobs = self._parse_response(response) if response else None
+                        if not jobs:
+                            last_page_reached = True
+                            break
+                        job_list.extend(jobs[: results_wanted - len(job_list)])
+
+                    if last_page_reached:
                         break
-                else:
-                    break
-                    
+
         except Exception as e:
             log.error(f"Error during scraping: {str(e)}")
-        
+
         log.info(f"Collected {len(job_list)} jobs from PracujPL")
         return JobResponse(jobs=job_list)
 
@@ -131,18 +191,18 @@ class PracujPLScraper(Scraper):
     def _get_headers(self):
         """Generate HTTP headers that mimic a modern web browser."""
         headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36',
-            'Accept': '*/*',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-            'Host': 'www.pracuj.pl',
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
+            "Accept": "*/*",
+            "Accept-Encoding": "gzip, deflate, br",
+            "DNT": "1",
+            "Upgrade-Insecure-Requests": "1",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "none",
+            "Sec-Fetch-User": "?1",
+            "Connection": "keep-alive",
+            "Cache-Control": "no-cache",
+            "Host": "www.pracuj.pl",
         }
         return headers
 
@@ -150,13 +210,11 @@ class PracujPLScraper(Scraper):
         """Makes an HTTP request using cloudscraper with proper error handling."""
         try:
             log.info(f"Making request to: {url}")
+            request_limiter.wait()
             headers = self._get_headers()
 
             response = self.scraper.get(
-                url,
-                headers=headers,
-                allow_redirects=True,
-                timeout=20
+                url, headers=headers, allow_redirects=True, timeout=20
             )
 
             log.info(f"Response status: {response.status_code}")
@@ -165,8 +223,10 @@ class PracujPLScraper(Scraper):
             if response.status_code == 403:
                 log.error(f"Cloudflare challenge likely failed. Status: 403.")
                 return None
-            elif "Przepraszamy, strona której szukasz jest niedostępna" in response.text or "detected unusual activity" in response.text:
-                log.warning(f"Potential block detected despite status {response.status_code}")
+            elif any(marker in response.content for marker in BLOCK_MARKERS):
+                log.warning(
+                    f"Potential block detected despite status {response.status_code}"
+                )
                 return None
 
             response.raise_for_status()
@@ -176,40 +236,92 @@ class PracujPLScraper(Scraper):
             log.error(f"Request failed for {url}: {str(e)}")
             return None
 
-    def _get_max_page_number(self, page_content: str) -> int:
+    def _get_max_page_number(self, page_content: bytes) -> int:
         """Get the maximum page number from pagination."""
+        match = MAX_PAGE_RE.search(page_content)
+        return int(match.group(1)) if match else 1
+
+    def _parse_response(self, response) -> List[JobPost] | None:
+        """Reads the offers from the embedded JSON, falling back to the HTML."""
+        jobs = self._parse_jobs_from_next_data(response.content, response.url)
+        if jobs is None:
+            jobs = self._parse_jobs_from_page(response.text, response.url)
+        return jobs
+
+    def _parse_jobs_from_next_data(
+        self, content: bytes, base_url: str
+    ) -> List[JobPost] | None:
+        """Parse job listings from the __NEXT_DATA__ JSON, None if it is not usable."""
+        match = NEXT_DATA_RE.search(content)
+        if not match:
+            return None
         try:
-            soup = BeautifulSoup(page_content, "html.parser")
-            max_page_element = soup.find(
-                "span", {"data-test": "top-pagination-max-page-number"}
-            )
-            if max_page_element and max_page_element.text:
-                return int(max_page_element.text.strip())
-        except Exception as e:
-            log.error(f"Error determining max page number: {str(e)}")
-        return 1
+            grouped_offers = _find_key(json.loads(match.group(1)), "groupedOffers")
+        except ValueError as e:
+            log.debug(f"Could not decode __NEXT_DATA__: {str(e)}")
+            return None
+        if not grouped_offers:
+            return None
 
-    def _parse_jobs_from_page(self, page_content: str, base_url: str) -> List[JobPost] | None:
+        country = Country.from_string(self.country)
+        job_posts = []
+        for group in grouped_offers:
+            try:
+                offer = (group.get("offers") or [{}])[0]
+                href = offer.get("offerAbsoluteUri")
+                if not group.get("jobTitle") or not href:
+                    continue
+                job_url = urljoin(base_url, href)
+                offer_id = offer.get("partitionId") or group.get("groupId")
+                job_posts.append(
+                    JobPost(
+                        id=(
+                            f"pracujpl-{offer_id}"
+                            if offer_id
+                            else f"pracujpl-{stable_hash(job_url)}"
+                        ),
+                        title=_clean_text(group["jobTitle"]),
+                        company_name=_clean_text(group.get("companyName")) or "N/A",
+                        location=Location(
+                            city=_clean_text(offer.get("displayWorkplace")) or "N/A",
+                            country=country,
+                        ),
+                        job_url=job_url,
+                    )
+                )
+            except Exception as e:
+                log.error(f"Error extracting job info from JSON: {str(e)}")
+
+        # An unexpected layout falls back to the HTML rather than returning nothing
+        return job_posts or None
+
+    def _parse_jobs_from_page(
+        self, page_content: str, base_url: str
+    ) -> List[JobPost] | None:
         """Parse job listings from the page content."""
         try:
-            soup = BeautifulSoup(page_content, "html.parser")
-            
+            soup = BeautifulSoup(
+                page_content, "html.parser", parse_only=OFFERS_STRAINER
+            )
+
             # Find the main offers container
-            main_offers_area = soup.find('div', id='offers-list')
+            main_offers_area = soup.find("div", id="offers-list")
             if not main_offers_area:
                 log.error("Could not find the main offers area ('div#offers-list')")
                 return None
 
             # Find all job offer elements
-            job_offer_elements = main_offers_area.find_all('div', attrs={'data-test-offerid': True})
-            
+            job_offer_elements = main_offers_area.find_all(
+                "div", attrs={"data-test-offerid": True}
+            )
+
             if not job_offer_elements:
                 log.debug("No job offer elements found on page")
                 return None
-            
+
             log.debug(f"Found {len(job_offer_elements)} job offer elements on page")
             job_posts = []
-            
+
             for element in job_offer_elements:
                 try:
                     job_post = self._extract_job_info(element, base_url)
@@ -217,7 +329,7 @@ class PracujPLScraper(Scraper):
                         job_posts.append(job_post)
                 except Exception as e:
                     log.error(f"Error extracting job info: {str(e)}")
-            
+
             return job_posts
         except Exception as e:
             log.error(f"Error parsing jobs from page: {str(e)}")
@@ -233,60 +345,76 @@ class PracujPLScraper(Scraper):
                 return None
 
             # Extract Position
-            position_tag = offer_element.find('h2', attrs={'data-test': 'offer-title'})
+            position_tag = offer_element.find("h2", attrs={"data-test": "offer-title"})
             if not position_tag:
                 log.warning("Could not find position tag")
                 return None
-            
+
             # Sometimes the title is inside an 'a' tag within the h2
-            link_in_title = position_tag.find('a')
+            link_in_title = position_tag.find("a")
             if link_in_title and link_in_title.text:
-                title = self._clean_text(link_in_title.text)
+                title = _clean_text(link_in_title.text)
             else:
-                title = self._clean_text(position_tag.text)
+                title = _clean_text(position_tag.text)
 
             # Extract Company Name
             company = "N/A"
-            company_section = offer_element.find('div', attrs={'data-test': 'section-company'})
+            company_section = offer_element.find(
+                "div", attrs={"data-test": "section-company"}
+            )
             if company_section:
-                company_tag = company_section.find('h3', attrs={'data-test': 'text-company-name'})
+                company_tag = company_section.find(
+                    "h3", attrs={"data-test": "text-company-name"}
+                )
                 if company_tag:
-                    company = self._clean_text(company_tag.text)
+                    company = _clean_text(company_tag.text)
             else:
                 # Fallback: Sometimes company name might be in the alt text of the logo image
-                logo_img = offer_element.find('img', attrs={'data-test': 'image-responsive'})
-                if logo_img and logo_img.get('alt'):
-                    company = self._clean_text(logo_img['alt'])
+                logo_img = offer_element.find(
+                    "img", attrs={"data-test": "image-responsive"}
+                )
+                if logo_img and logo_img.get("alt"):
+                    company = _clean_text(logo_img["alt"])
 
             # Extract Location (City)
             location = "N/A"
-            location_tag = offer_element.find('h4', attrs={'data-test': 'text-region'})
+            location_tag = offer_element.find("h4", attrs={"data-test": "text-region"})
             if location_tag:
-                location = self._clean_text(location_tag.text)
+                location = _clean_text(location_tag.text)
             else:
                 # Sometimes location might be in a list item if multiple locations exist
-                location_list_item = offer_element.find('li', attrs={'data-test': lambda x: x and x.startswith('offer-location-')})
+                location_list_item = offer_element.find(
+                    "li", attrs={"data-test": LOCATION_ITEM_RE}
+                )
                 if location_list_item:
-                    location = self._clean_text(location_list_item.text)
+                    location = _clean_text(location_list_item.text)
 
             # Extract Offer Link
             link_tag = None
             if position_tag:  # Prefer link within the title h2
-                link_tag = position_tag.find('a')
+                link_tag = position_tag.find("a")
             if not link_tag:  # Fallback to the direct link if not in title
-                link_tag = offer_element.find('a', attrs={'data-test': 'link-offer'}, recursive=False)
+                link_tag = offer_element.find(
+                    "a", attrs={"data-test": "link-offer"}, recursive=False
+                )
 
-            if not link_tag or not link_tag.get('href'):
+            if not link_tag or not link_tag.get("href"):
                 log.warning("Could not find offer link - skipping this job")
                 return None
-            
-            job_url = urljoin(base_url, link_tag['href'])
+
+            job_url = urljoin(base_url, link_tag["href"])
 
             # Create job ID - now we're guaranteed to have job_url
-            job_id = f"pracujpl-{offer_id}" if offer_id else f"pracujpl-{abs(hash(job_url))}"
+            job_id = (
+                f"pracujpl-{offer_id}"
+                if offer_id
+                else f"pracujpl-{stable_hash(job_url)}"
+            )
 
             # Create location object
-            location_obj = Location(city=location, country=Country.from_string(self.country))
+            location_obj = Location(
+                city=location, country=Country.from_string(self.country)
+            )
 
             return JobPost(
                 id=job_id,
@@ -298,12 +426,3 @@ class PracujPLScraper(Scraper):
         except Exception as e:
             log.error(f"Error extracting job details: {str(e)}")
             return None
-
-    def _clean_text(self, text):
-        """Normalizes and sanitizes text by removing redundant whitespace."""
-        if not text:
-            return ""
-        # Replace non-breaking spaces and trim
-        text = text.replace('\xa0', ' ').strip()
-        # Collapse multiple whitespace characters into a single space
-        return re.sub(r'\s+', ' ', text.strip())
\ No newline at end of file
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import os
 import re
+import sqlite3
+import threading
+import time
+from hashlib import blake2b
 from itertools import cycle
+from typing import Any, Coroutine, TypeVar
 
 import numpy as np
 import requests
@@ -13,6 +21,8 @@ from requests.adapters import HTTPAdapter, Retry
 
 from jobspy.model import CompensationInterval, JobType, Site
 
+T = TypeVar("T")
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
@@ -165,6 +175,174 @@ def extract_emails_from_text(text: str) -> list[str] | None:
     return email_regex.findall(text)
 
 
+def stable_hash(value: str) -> str:
+    """
+    Returns a 64-bit hex digest of the value. Unlike hash() it is not salted per
+    process, so ids built from it stay the same across runs and can be deduplicated.
+    """
+    return blake2b(value.encode(), digest_size=8).hexdigest()
+
+
+_async_loop: asyncio.AbstractEventLoop | None = None
+_async_loop_lock = threading.Lock()
+
+
+def get_async_loop() -> asyncio.AbstractEventLoop:
+    """Returns the background event loop shared by every async scraper."""
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_async_loop.run_forever, name="jobspy-async", daemon=True
+            ).start()
+    return _async_loop
+
+
+def run_async(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """
+    Runs a coroutine on the shared background event loop and blocks until it is done.
+    Unlike asyncio.run it works when the caller already has a running loop (Jupyter,
+    async web handlers) and does not set up and tear down a loop on every call.
+    Safe to call from any thread, including several at once.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_async_loop()).result(timeout)
+
+
+class JSONArrayStream:
+    """
+    Decodes the items of a JSON array whose text arrives in chunks, e.g. from a
+    streamed LLM response, returning each item as soon as it is complete.
+    """
+
+    _decoder = json.JSONDecoder()
+
+    def __init__(self):
+        self._buffer = ""
+        self._started = False
+
+    def feed(self, text: str) -> list:
+        self._buffer += text
+        items = []
+        while True:
+            rest = self._buffer.lstrip()
+            if not self._started:
+                if not rest:
+                    break
+                if rest[0] != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                self._buffer = rest[1:]
+                continue
+            rest = rest.lstrip(", \t\r\n")
+            if not rest or rest[0] == "]":
+                self._buffer = rest
+                break
+            try:
+                item, end = self._decoder.raw_decode(rest)
+            except json.JSONDecodeError:
+                # the item is not complete yet, wait for more text
+                self._buffer = rest
+                break
+            items.append(item)
+            self._buffer = rest[end:]
+        return items
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` requests per `period` seconds with bursts of up to
+    `burst` requests, shared by every thread or task that waits on it.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: int = 1):
+        self.interval = period / rate
+        self.burst = burst
+        self._next_free = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        time.sleep(self._reserve())
+
+    async def wait_async(self) -> None:
+        await asyncio.sleep(self._reserve())
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long to wait until it is valid."""
+        with self._lock:
+            now = time.monotonic()
+            next_free = max(self._next_free, now)
+            self._next_free = next_free + self.interval
+            return max(0.0, next_free - (self.burst - 1) * self.interval - now)
+
+
+class TTLCache:
+    """
+    Small on-disk string cache backed by sqlite, entries expire after `ttl` seconds.
+    Lives in $JOBSPY_CACHE_DIR (default ~/.cache/jobspy) so it survives re-runs, is
+    turned off by setting JOBSPY_CACHE_DIR to an empty string, and degrades to a
+    no-op if the database cannot be opened.
+    """
+
+    def __init__(self, name: str, ttl: float = 24 * 60 * 60):
+        self.name = name
+        self.path: str | None = None
+        self.ttl = ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._disabled = False
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+            return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, value, time.time() + self.ttl),
+            )
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._conn is None and not self._disabled:
+            # Read on first use, so the variable can be set after importing jobspy
+            directory = os.getenv(
+                "JOBSPY_CACHE_DIR",
+                os.path.join(os.path.expanduser("~"), ".cache", "jobspy"),
+            )
+            if not directory:
+                self._disabled = True
+                return None
+            self.path = os.path.join(directory, f"{self.name}.sqlite")
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache "
+                    "(key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+                )
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logging.getLogger("JobSpy:TTLCache").warning(
+                    f"Cache {self.path} unavailable: {e}"
+                )
+                self._disabled = True
+        return self._conn
+
+
 def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
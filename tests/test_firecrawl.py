@@ -0,0 +1,41 @@
+from jobspy.infojobs import InfoJobsScraper
+from jobspy.model import Country, JobListing, JobType, ScraperInput, Site
+
+
+def test_cached_listings_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBSPY_CACHE_DIR", str(tmp_path))
+    scraper = InfoJobsScraper()
+    listing = JobListing(
+        job_title="Data Engineer",
+        job_link="https://www.infojobs.net/madrid/data-engineer/of-i123",
+        job_description="Pipelines",
+        job_company="Acme",
+        job_location="Madrid",
+        job_type=["contract"],
+        job_interval="YEARLY",
+        job_salary_min=30000,
+        job_salary_max=40000,
+        job_salary_currency="EUR",
+    )
+
+    async def scrape_with_firecrawl(url):
+        return "markdown"
+
+    async def process_with_gemini(markdown_content):
+        yield listing
+
+    monkeypatch.setattr(scraper, "_scrape_with_firecrawl", scrape_with_firecrawl)
+    monkeypatch.setattr(scraper, "_process_with_gemini", process_with_gemini)
+    scraper_input = ScraperInput(site_type=[Site.INFOJOBS], search_term="data")
+    fresh = scraper.scrape(scraper_input)
+
+    async def no_network(url):
+        raise AssertionError("cache hit should not call Firecrawl")
+
+    monkeypatch.setattr(scraper, "_scrape_with_firecrawl", no_network)
+    cached = scraper.scrape(scraper_input)
+
+    assert len(cached.jobs) == 1
+    assert cached.jobs == fresh.jobs
+    assert cached.jobs[0].location.country == Country.SPAIN
+    assert cached.jobs[0].job_type == [JobType.CONTRACT]
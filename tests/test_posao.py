@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from jobspy.posao import PosaoHRScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def test_parse_job_links_from_results_page():
+    html = (FIXTURES / "posao_results.html").read_text(encoding="utf-8")
+
+    links = PosaoHRScraper()._parse_job_links(html)
+
+    assert [job_url for _, job_url in links] == [
+        "https://www.posao.hr/jobs/python-developer/2341087/",
+        "https://www.posao.hr/jobs/data-engineer/2339960/",
+    ]
+    assert links[0][0].startswith("Python Developer Infobip d.o.o., Zagreb")
@@ -0,0 +1,18 @@
+from jobspy.util import TTLCache
+
+
+def test_ttl_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBSPY_CACHE_DIR", str(tmp_path))
+    cache = TTLCache("test")
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert (tmp_path / "test.sqlite").exists()
+
+
+def test_ttl_cache_disabled_by_empty_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("JOBSPY_CACHE_DIR", "")
+    monkeypatch.chdir(tmp_path)
+    cache = TTLCache("test")
+    cache.set("key", "value")
+    assert cache.get("key") is None
+    assert not list(tmp_path.iterdir())